@@ -0,0 +1,111 @@
+# bench_render.py
+# Micro-benchmark of per-reply render cost. Run: python bench_render.py
+import timeit
+
+from telegram import InlineKeyboardButton, InlineKeyboardMarkup
+
+from render import (
+    MAX_MESSAGE_LENGTH,
+    START_KEYBOARD,
+    md,
+    render_welcome,
+    safe_cut,
+    split_message,
+    strip_markdown,
+    text_length,
+)
+
+FIRST_NAME = "Zihan_*Test*"
+N_CODES = 5000
+
+
+def welcome_inline():
+    # What /start did before: rebuild keyboard and text on every call
+    keyboard = [
+        [InlineKeyboardButton("🎁 Redeem Code", callback_data="redeem_help")],
+        [InlineKeyboardButton("🏆 Leaderboard", callback_data="leaderboard")],
+        [InlineKeyboardButton("ℹ️ Bot Info", callback_data="info")],
+        [InlineKeyboardButton("❓ Help", callback_data="help")],
+    ]
+    reply_markup = InlineKeyboardMarkup(keyboard)
+    welcome_text = f"""
+🎉 **Welcome to ZIHAN GIVEAWAY Bot!** 🇵🇸
+
+Hello {FIRST_NAME}! 👋
+
+🎁 Ready to claim some amazing prizes? Use your redemption codes here!
+🏆 Compete with others and see who's winning!
+📱 Easy to use - just follow the commands!
+
+Choose an option below to get started:
+        """
+    return welcome_text, reply_markup
+
+
+def welcome_prebuilt():
+    return render_welcome(FIRST_NAME), START_KEYBOARD
+
+
+CODES = {f"GIFT{i:06d}": f"$5 Gift_Card #{i}" for i in range(N_CODES)}
+
+
+def listcodes_render():
+    lines = ["📋 **ALL CODES:**\n"]
+    for code, prize in CODES.items():
+        lines.append(f"**{md(code)}** - {md(prize)} (🎁 Available)")
+    return split_message("\n".join(lines))
+
+
+def assert_valid_chunks(chunks):
+    for chunk in chunks:
+        assert text_length(chunk) <= MAX_MESSAGE_LENGTH, text_length(chunk)
+        # No chunk may end inside an escape or an open entity
+        assert safe_cut(chunk, len(chunk)) == len(chunk), chunk[-20:]
+
+
+def check():
+    # Oversized line full of `\_` escapes: cut between escapes, nothing lost
+    line = "a\\_b " * 2000
+    chunks = split_message(line)
+    assert len(chunks) > 1
+    assert_valid_chunks(chunks)
+    assert "".join(chunks) == line
+
+    # Unclosed `*` entity: text before it is kept, the rest is sent as plain text
+    line = "ok " * 100 + "*" + "x" * 5000
+    chunks = split_message(line)
+    assert_valid_chunks(chunks)
+    assert chunks[0] == "ok " * 100
+    assert strip_markdown("".join(chunks[1:])) == "x" * 5000
+
+    # 3000 emoji = 6000 UTF-16 units, so one line must become two messages
+    line = "🎁" * 3000
+    chunks = split_message(line)
+    assert len(chunks) == 2
+    assert_valid_chunks(chunks)
+    assert "".join(chunks) == line
+
+    # Escaping then stripping gives back the original text
+    for text in ["Zihan_*Test*", "`code` [link] a_b_c", "\\ plain \\"]:
+        assert strip_markdown(md(text)) == text, text
+
+    print("render checks passed")
+
+
+def bench(name, func, number):
+    total = timeit.timeit(func, number=number)
+    print(f"{name:<32} {total / number * 1e6:>10.2f} µs/reply")
+
+
+def main():
+    check()
+    bench("/start (rebuild per call)", welcome_inline, 20000)
+    bench("/start (prebuilt)", welcome_prebuilt, 20000)
+    bench("md() escape", lambda: md(FIRST_NAME), 100000)
+    bench(f"/listcodes render+split ({N_CODES})", listcodes_render, 20)
+    bench(f"/listcodes as file ({N_CODES})", lambda: strip_markdown("\n".join(listcodes_render())), 20)
+    print(f"/listcodes chunks: {len(listcodes_render())}")
+
+
+if __name__ == "__main__":
+    main()
@@ -4,15 +4,36 @@ import json
 import logging
 import os
 import random
+import re
 import string
 from datetime import datetime
-from typing import Dict, List
+from typing import Dict, List, Optional, Tuple
 
-from telegram import Update, InlineKeyboardButton, InlineKeyboardMarkup
+from telegram import Update
 from telegram.ext import ContextTypes
 
+from render import (
+    HELP_TEXT,
+    INFO_TEXT,
+    START_KEYBOARD,
+    md,
+    md_code,
+    render_welcome,
+    reply_chunked,
+)
+
 logger = logging.getLogger(__name__)
 
+# Targets in batched admin commands may be separated by whitespace, commas or semicolons
+TARGET_SPLIT_RE = re.compile(r"[\s,;]+")
+# Argument that tells a batched admin command to read targets from the replied-to file
+FILE_MARKER = "-"
+# How many individual targets to echo back in a batch summary, and how many characters of each
+SUMMARY_PREVIEW = 20
+PREVIEW_WIDTH = 40
+# Shortest prefix a `PREFIX*` pattern may use, so a stray `*` can't match every code
+MIN_PREFIX_LENGTH = 2
+
 
 class GiveawayBot:
     def __init__(self, token: str, admin_id: int, data_file: str = "bot_data.json"):
@@ -59,6 +80,119 @@ class GiveawayBot:
     async def is_admin(self, user_id: int) -> bool:
         return user_id == self.admin_id
 
+    async def collect_targets(
+        self, update: Update, context: ContextTypes.DEFAULT_TYPE, args: List[str]
+    ) -> Tuple[List[str], Optional[str]]:
+        """Gather batch targets from the command arguments.
+
+        A FILE_MARKER argument (`-`) also reads targets from the uploaded
+        file the command replies to; a replied-to file is never read without
+        it. Returns (tokens, error); on error nothing should be applied.
+        """
+        tokens: List[str] = []
+        for arg in args:
+            if arg != FILE_MARKER:
+                tokens.extend(t for t in TARGET_SPLIT_RE.split(arg) if t)
+
+        if FILE_MARKER in args:
+            reply = update.message.reply_to_message if update.message else None
+            if not (reply and reply.document):
+                return [], f"❌ Send the command with `{FILE_MARKER}` as a reply to an uploaded list!"
+            try:
+                tg_file = await context.bot.get_file(reply.document.file_id)
+                content = (await tg_file.download_as_bytearray()).decode("utf-8", errors="ignore")
+            except Exception as e:
+                logger.error(f"Failed to read target list file: {e}")
+                return [], "❌ Could not read the attached list."
+            tokens.extend(t for t in TARGET_SPLIT_RE.split(content) if t)
+
+        # Drop duplicates but keep the order the admin gave
+        return list(dict.fromkeys(tokens)), None
+
+    def expand_codes(self, tokens: List[str], unredeemed_only: bool = False):
+        """Resolve code tokens to existing codes.
+
+        A token ending in `*` is a prefix pattern (`GIFT*`). Patterns with a
+        prefix shorter than MIN_PREFIX_LENGTH are rejected. With
+        `unredeemed_only`, patterns skip codes that were already redeemed;
+        explicitly named codes always match. Returns (matched, missing,
+        rejected, redeemed_only), the last holding patterns whose only
+        matches were skipped as redeemed.
+        """
+        matched: List[str] = []
+        missing: List[str] = []
+        rejected: List[str] = []
+        redeemed_only: List[str] = []
+        for token in tokens:
+            token = token.upper()
+            if token.endswith("*"):
+                prefix = token[:-1]
+                if len(prefix) < MIN_PREFIX_LENGTH:
+                    rejected.append(token)
+                    continue
+                hits = [code for code in self.codes if code.startswith(prefix)]
+                if unredeemed_only:
+                    unredeemed = [code for code in hits if code not in self.redeemed_codes]
+                    if hits and not unredeemed:
+                        redeemed_only.append(token)
+                        continue
+                    hits = unredeemed
+                if hits:
+                    matched.extend(hits)
+                else:
+                    missing.append(token)
+            elif token in self.codes:
+                matched.append(token)
+            else:
+                missing.append(token)
+        return list(dict.fromkeys(matched)), missing, rejected, redeemed_only
+
+    def code_problem_lines(self, missing: List[str], rejected: List[str], redeemed_only: List[str] = ()) -> str:
+        """Summary lines for code tokens that were not applied."""
+        text = ""
+        if missing:
+            text += f"\n❌ **Not found ({len(missing)}):** {self.preview(missing, code=True)}"
+        if redeemed_only:
+            text += (
+                f"\nℹ️ **Only redeemed codes match ({len(redeemed_only)}):** "
+                f"{self.preview(redeemed_only, code=True)}"
+            )
+        if rejected:
+            text += (
+                f"\n⚠️ **Prefix too short, min {MIN_PREFIX_LENGTH} chars ({len(rejected)}):** "
+                f"{self.preview(rejected, code=True)}"
+            )
+        return text
+
+    def parse_user_ids(self, tokens: List[str]):
+        """Split tokens into valid user IDs and rejected tokens."""
+        user_ids: List[int] = []
+        invalid: List[str] = []
+        for token in tokens:
+            try:
+                user_ids.append(int(token))
+            except ValueError:
+                invalid.append(token)
+        return list(dict.fromkeys(user_ids)), invalid
+
+    @staticmethod
+    def preview(items, code: bool = False) -> str:
+        """Short, comma-separated sample of `items` for a summary reply.
+
+        Each item is cut to PREVIEW_WIDTH characters so tokens from an
+        uploaded file can't push the reply over Telegram's size limit.
+        """
+        items = [str(item) for item in items]
+        shown = []
+        for item in items[:SUMMARY_PREVIEW]:
+            if len(item) > PREVIEW_WIDTH:
+                item = item[:PREVIEW_WIDTH] + "…"
+            shown.append(md_code(item) if code else md(item))
+        text = ", ".join(shown)
+        if len(items) > SUMMARY_PREVIEW:
+            text += f" … (+{len(items) - SUMMARY_PREVIEW} more)"
+        return text
+
     # ===== User command implementations (called from main.py) =====
     async def start_command_user(self, update: Update, context: ContextTypes.DEFAULT_TYPE):
         user = update.effective_user
@@ -74,29 +208,9 @@ class GiveawayBot:
         self.users.add(user_id)
         self.save_data()
 
-        keyboard = [
-            [InlineKeyboardButton("🎁 Redeem Code", callback_data="redeem_help")],
-            [InlineKeyboardButton("🏆 Leaderboard", callback_data="leaderboard")],
-            [InlineKeyboardButton("ℹ️ Bot Info", callback_data="info")],
-            [InlineKeyboardButton("❓ Help", callback_data="help")],
-        ]
-        reply_markup = InlineKeyboardMarkup(keyboard)
-
-        welcome_text = f"""
-🎉 **Welcome to ZIHAN GIVEAWAY Bot!** 🇵🇸
-
-Hello {user.first_name}! 👋
-
-🎁 Ready to claim some amazing prizes? Use your redemption codes here!
-🏆 Compete with others and see who's winning!
-📱 Easy to use - just follow the commands!
-
-Choose an option below to get started:
-        """
-
         if update.message:
             await update.message.reply_text(
-                welcome_text, reply_markup=reply_markup, parse_mode="Markdown"
+                render_welcome(user.first_name), reply_markup=START_KEYBOARD, parse_mode="Markdown"
             )
 
     async def redeem_command_user(self, update: Update, context: ContextTypes.DEFAULT_TYPE):
@@ -128,9 +242,10 @@ Choose an option below to get started:
             redeemer_info = self.redeemed_codes[code]
             await update.message.reply_text(
                 f"❌ **Code already redeemed!**\n\n"
-                f"👤 **Redeemed by:** {redeemer_info['username']}\n"
+                f"👤 **Redeemed by:** {md(redeemer_info['username'])}\n"
                 f"🕐 **Date:** {redeemer_info['date']}\n"
-                f"🆔 **User ID:** {redeemer_info['user_id']}"
+                f"🆔 **User ID:** {redeemer_info['user_id']}",
+                parse_mode="Markdown",
             )
             return
 
@@ -148,9 +263,9 @@ Choose an option below to get started:
 
         await update.message.reply_text(
             f"🎉 **Congratulations!** 🎉\n\n"
-            f"✅ **Code:** `{code}`\n"
-            f"🎁 **Prize:** {prize}\n"
-            f"👤 **Winner:** {user.first_name}\n"
+            f"✅ **Code:** {md_code(code)}\n"
+            f"🎁 **Prize:** {md(prize)}\n"
+            f"👤 **Winner:** {md(user.first_name)}\n"
             f"🕐 **Redeemed:** {redemption_info['date']}\n\n"
             f"**Take a Screenshot and send to @alwayszihan and wait a few**\n"
             f"🎊 Enjoy your prize!",
@@ -160,11 +275,11 @@ Choose an option below to get started:
         try:
             admin_message = (
                 f"🔔 **New Code Redemption!**\n\n"
-                f"👤 **User:** {redemption_info['username']}\n"
+                f"👤 **User:** {md(redemption_info['username'])}\n"
                 f"🆔 **ID:** {user_id}\n"
-                f"📛 **Name:** {user.first_name}\n"
-                f"✅ **Code:** `{code}`\n"
-                f"🎁 **Prize:** {prize}\n"
+                f"📛 **Name:** {md(user.first_name)}\n"
+                f"✅ **Code:** {md_code(code)}\n"
+                f"🎁 **Prize:** {md(prize)}\n"
                 f"🕐 **Time:** {redemption_info['date']}"
             )
             await context.bot.send_message(
@@ -176,63 +291,12 @@ Choose an option below to get started:
     async def info_command_user(self, update: Update, context: ContextTypes.DEFAULT_TYPE):
         if not update.message:
             return
-        info_text = """
-🤖 **ZIHAN GIVEAWAY BOT** 🇵🇸
-
-👨‍💻 **Developer:** Latiful Hassan Zihan
-📱 **Telegram:** @alwayzihan  
-🌍 **Location:** Bangladesh 🇧🇩
-💻 **Language:** Python
-
-📋 **Available Commands:**
-
-👤 **User Commands**
-/start - Shows the main welcome menu
-/redeem <code> - Claim a prize with your code
-/leaderboard - See the top winners
-/help - Shows this help message
-
-👑 **Admin Commands**
-/stats - View bot statistics
-/listcodes - List all codes and prizes  
-/addcode <code> - Add a new code
-/addprize <code> <prize> - Set prize for a code
-/delcode <code> - Delete a code
-/gencode <num> <prefix> - Generate codes
-/broadcast <msg> - Send a message to all users
-/ban <user_id> - Ban a user
-/unban <user_id> - Unban a user
-/resetgiveaway - Clear the winner list for a new giveaway
-/stopbot - Stop the bot
-
-🎁 **Happy claiming!**
-        """
-        await update.message.reply_text(info_text, parse_mode="Markdown")
+        await update.message.reply_text(INFO_TEXT, parse_mode="Markdown")
 
     async def help_command_user(self, update: Update, context: ContextTypes.DEFAULT_TYPE):
         if not update.message:
             return
-        help_text = """
-❓ **HELP & INSTRUCTIONS**
-
-🎁 **How to redeem codes:**
-1. Get a code from @alwayszihan
-2. Use `/redeem <your_code>`
-3. Enjoy your prize! 🎉
-
-📝 **Examples:**
-• `/redeem GIFT123` - Redeem code GIFT123
-• `/leaderboard` - See top winners
-• `/info` - Bot information
-
-⚠️ **Important Notes:**
-• Each code can only be used once
-• Codes are case-insensitive
-• Contact @alwayszihan for new codes
-
-🆘 **Need help?** Contact @alwayszihan
-        """
-        await update.message.reply_text(help_text, parse_mode="Markdown")
+        await update.message.reply_text(HELP_TEXT, parse_mode="Markdown")
 
     async def leaderboard_command_user(self, update: Update, context: ContextTypes.DEFAULT_TYPE):
         if not update.message:
@@ -252,14 +316,14 @@ Choose an option below to get started:
 
         sorted_users = sorted(user_stats.items(), key=lambda x: x[1]["count"], reverse=True)
 
-        leaderboard_text = "🏆 **LEADERBOARD** 🏆\n\n"
+        lines = ["🏆 **LEADERBOARD** 🏆\n"]
         emojis = ["🥇", "🥈", "🥉"] + ["🏅"] * 7
 
         for i, (_, stats) in enumerate(sorted_users[:10]):
             emoji = emojis[i] if i < len(emojis) else "🎯"
-            leaderboard_text += f"{emoji} **{stats['username']}** - {stats['count']} codes\n"
+            lines.append(f"{emoji} **{md(stats['username'])}** - {stats['count']} codes")
 
-        await update.message.reply_text(leaderboard_text, parse_mode="Markdown")
+        await reply_chunked(update.message, "\n".join(lines), parse_mode="Markdown")
 
     # ===== Admin-only commands (exposed directly to handlers in main.py) =====
     async def stats_command_admin(self, update: Update, context: ContextTypes.DEFAULT_TYPE):
@@ -301,13 +365,13 @@ Choose an option below to get started:
             await update.message.reply_text("📋 **No codes available.**")
             return
 
-        codes_text = "📋 **ALL CODES:**\n\n"
+        lines = ["📋 **ALL CODES:**\n"]
         for code in self.codes:
             status = "✅ Redeemed" if code in self.redeemed_codes else "🎁 Available"
             prize = self.prizes.get(code, "🎁 No prize set")
-            codes_text += f"**{code}** - {prize} ({status})\n"
+            lines.append(f"**{md(code)}** - {md(prize)} ({status})")
 
-        await update.message.reply_text(codes_text, parse_mode="Markdown")
+        await reply_chunked(update.message, "\n".join(lines), filename="codes.txt", parse_mode="Markdown")
 
     async def addcode_command_admin(self, update: Update, context: ContextTypes.DEFAULT_TYPE):
         if not update.message:
@@ -336,8 +400,8 @@ Choose an option below to get started:
 
         await update.message.reply_text(
             f"✅ **Code added successfully!**\n\n"
-            f"📝 **Code:** `{code}`\n"
-            f"💡 **Tip:** Use `/addprize {code} <prize>` to set a prize for this code.",
+            f"📝 **Code:** {md_code(code)}\n"
+            f"💡 **Tip:** Use {md_code(f'/addprize {code} <prize>')} to set a prize for this code.",
             parse_mode="Markdown",
         )
 
@@ -348,31 +412,49 @@ Choose an option below to get started:
             await update.message.reply_text("❌ This command is for admins only.")
             return
 
+        # `/addprize - <prize>` sent as a reply to an uploaded code list
+        from_file = bool(context.args) and context.args[0] == FILE_MARKER
+
         if len(context.args) < 2:
             await update.message.reply_text(
                 "❌ Please provide both code and prize!\n\n"
-                "**Usage:** `/addprize <code> <prize>`\n"
-                "**Example:** `/addprize GIFT123 $50 Amazon Gift Card`",
+                "**Usage:** `/addprize <code[,code...]|prefix*> <prize>`\n"
+                "**Example:** `/addprize GIFT123 $50 Amazon Gift Card`\n"
+                "**Example:** `/addprize GIFT* $5 Steam Card`\n\n"
+                "💡 Reply to an uploaded code list with `/addprize - <prize>` to set it for every listed code.",
                 parse_mode="Markdown",
             )
             return
 
-        code = context.args[0].upper()
+        tokens, error = await self.collect_targets(update, context, context.args[:1])
+        if error:
+            await update.message.reply_text(error, parse_mode="Markdown")
+            return
         prize = " ".join(context.args[1:])
 
-        if code not in self.codes:
-            await update.message.reply_text(f"❌ Code `{code}` doesn't exist! Use `/addcode {code}` first.")
+        codes, missing, rejected, _ = self.expand_codes(tokens)
+
+        if not codes:
+            await update.message.reply_text(
+                "❌ **No matching codes found!** Use `/addcode` first."
+                + self.code_problem_lines(missing, rejected),
+                parse_mode="Markdown",
+            )
             return
 
-        self.prizes[code] = prize
+        for code in codes:
+            self.prizes[code] = prize
         self.save_data()
 
-        await update.message.reply_text(
+        summary = (
             f"✅ **Prize set successfully!**\n\n"
-            f"📝 **Code:** `{code}`\n"
-            f"🎁 **Prize:** {prize}",
-            parse_mode="Markdown",
+            f"🎁 **Prize:** {md(prize)}\n"
         )
+        if from_file:
+            summary += f"📎 **From file:** {len(tokens)} codes\n"
+        summary += f"📝 **Codes ({len(codes)}):** {self.preview(codes, code=True)}"
+        summary += self.code_problem_lines(missing, rejected)
+        await reply_chunked(update.message, summary, parse_mode="Markdown")
 
     async def delcode_command_admin(self, update: Update, context: ContextTypes.DEFAULT_TYPE):
         if not update.message:
@@ -381,35 +463,46 @@ Choose an option below to get started:
             await update.message.reply_text("❌ This command is for admins only.")
             return
 
-        if not context.args:
+        tokens, error = await self.collect_targets(update, context, context.args)
+
+        if error:
+            await update.message.reply_text(error, parse_mode="Markdown")
+            return
+
+        if not tokens:
             await update.message.reply_text(
                 "❌ Please provide a code to delete!\n\n"
-                "**Usage:** `/delcode <code>`\n"
-                "**Example:** `/delcode GIFT123`",
+                "**Usage:** `/delcode <code> [code...]`\n"
+                "**Example:** `/delcode GIFT123 GIFT456`\n"
+                "**Example:** `/delcode GIFT*` - delete all unredeemed GIFT codes\n\n"
+                "💡 Reply to an uploaded code list with `/delcode -` to delete every listed code.",
                 parse_mode="Markdown",
             )
             return
 
-        code = context.args[0].upper()
+        codes, missing, rejected, redeemed_only = self.expand_codes(tokens, unredeemed_only=True)
 
-        if code not in self.codes:
-            await update.message.reply_text(f"❌ Code `{code}` doesn't exist!")
+        if not codes:
+            await update.message.reply_text(
+                "❌ **No matching codes found!**" + self.code_problem_lines(missing, rejected, redeemed_only),
+                parse_mode="Markdown",
+            )
             return
 
-        # Remove code and any related data
-        del self.codes[code]
-        if code in self.prizes:
-            del self.prizes[code]
-        if code in self.redeemed_codes:
-            del self.redeemed_codes[code]
+        # Remove codes and any related data
+        for code in codes:
+            del self.codes[code]
+            self.prizes.pop(code, None)
+            self.redeemed_codes.pop(code, None)
 
         self.save_data()
 
-        await update.message.reply_text(
-            f"✅ **Code deleted successfully!**\n\n"
-            f"🗑️ **Deleted:** `{code}`",
-            parse_mode="Markdown",
+        summary = (
+            f"✅ **Codes deleted successfully!**\n\n"
+            f"🗑️ **Deleted ({len(codes)}):** {self.preview(codes, code=True)}"
         )
+        summary += self.code_problem_lines(missing, rejected, redeemed_only)
+        await reply_chunked(update.message, summary, parse_mode="Markdown")
 
     async def gencode_command_admin(self, update: Update, context: ContextTypes.DEFAULT_TYPE):
         if not update.message:
@@ -456,13 +549,11 @@ Choose an option below to get started:
 
         self.save_data()
 
-        codes_text = "✅ **Generated Codes:**\n\n"
-        for code in generated_codes:
-            codes_text += f"`{code}`\n"
+        lines = ["✅ **Generated Codes:**\n"]
+        lines.extend(md_code(code) for code in generated_codes)
+        lines.append(f"\n📊 **Total:** {len(generated_codes)} codes generated")
 
-        codes_text += f"\n📊 **Total:** {len(generated_codes)} codes generated"
-
-        await update.message.reply_text(codes_text, parse_mode="Markdown")
+        await reply_chunked(update.message, "\n".join(lines), filename="generated_codes.txt", parse_mode="Markdown")
 
     async def broadcast_command_admin(self, update: Update, context: ContextTypes.DEFAULT_TYPE):
         if not update.message:
@@ -514,33 +605,47 @@ Choose an option below to get started:
             await update.message.reply_text("❌ This command is for admins only.")
             return
 
-        if not context.args:
+        tokens, error = await self.collect_targets(update, context, context.args)
+
+        if error:
+            await update.message.reply_text(error, parse_mode="Markdown")
+            return
+
+        if not tokens:
             await update.message.reply_text(
                 "❌ Please provide a user ID to ban!\n\n"
-                "**Usage:** `/ban <user_id>`\n"
-                "**Example:** `/ban 123456789`",
+                "**Usage:** `/ban <user_id> [user_id...]`\n"
+                "**Example:** `/ban 123456789 987654321`\n\n"
+                "💡 Reply to an uploaded ID list with `/ban -` to ban every listed user.",
                 parse_mode="Markdown",
             )
             return
 
-        try:
-            user_id = int(context.args[0])
-        except ValueError:
-            await update.message.reply_text("❌ User ID must be a number!")
-            return
-
-        if user_id == self.admin_id:
-            await update.message.reply_text("❌ You cannot ban yourself!")
-            return
+        user_ids, invalid = self.parse_user_ids(tokens)
+        skipped_self = self.admin_id in user_ids
+        already = [user_id for user_id in user_ids if user_id in self.banned_users]
+        to_ban = [
+            user_id for user_id in user_ids
+            if user_id != self.admin_id and user_id not in self.banned_users
+        ]
 
-        self.banned_users.add(user_id)
-        self.save_data()
+        if to_ban:
+            self.banned_users.update(to_ban)
+            self.save_data()
+            summary = (
+                f"✅ **Users banned successfully!**\n\n"
+                f"🚫 **Banned ({len(to_ban)}):** {self.preview(to_ban)}"
+            )
+        else:
+            summary = "❌ **No users were banned!**\n"
 
-        await update.message.reply_text(
-            f"✅ **User banned successfully!**\n\n"
-            f"🚫 **Banned User ID:** {user_id}",
-            parse_mode="Markdown",
-        )
+        if already:
+            summary += f"\nℹ️ **Already banned ({len(already)}):** {self.preview(already)}"
+        if skipped_self:
+            summary += "\n⚠️ **Skipped:** you cannot ban yourself"
+        if invalid:
+            summary += f"\n❌ **Invalid IDs ({len(invalid)}):** {self.preview(invalid, code=True)}"
+        await reply_chunked(update.message, summary, parse_mode="Markdown")
 
     async def unban_command_admin(self, update: Update, context: ContextTypes.DEFAULT_TYPE):
         if not update.message:
@@ -549,33 +654,41 @@ Choose an option below to get started:
             await update.message.reply_text("❌ This command is for admins only.")
             return
 
-        if not context.args:
+        tokens, error = await self.collect_targets(update, context, context.args)
+
+        if error:
+            await update.message.reply_text(error, parse_mode="Markdown")
+            return
+
+        if not tokens:
             await update.message.reply_text(
                 "❌ Please provide a user ID to unban!\n\n"
-                "**Usage:** `/unban <user_id>`\n"
-                "**Example:** `/unban 123456789`",
+                "**Usage:** `/unban <user_id> [user_id...]`\n"
+                "**Example:** `/unban 123456789 987654321`\n\n"
+                "💡 Reply to an uploaded ID list with `/unban -` to unban every listed user.",
                 parse_mode="Markdown",
             )
             return
 
-        try:
-            user_id = int(context.args[0])
-        except ValueError:
-            await update.message.reply_text("❌ User ID must be a number!")
-            return
-
-        if user_id not in self.banned_users:
-            await update.message.reply_text(f"❌ User {user_id} is not banned!")
-            return
-
-        self.banned_users.discard(user_id)
-        self.save_data()
+        user_ids, invalid = self.parse_user_ids(tokens)
+        to_unban = [user_id for user_id in user_ids if user_id in self.banned_users]
+        not_banned = [user_id for user_id in user_ids if user_id not in self.banned_users]
 
-        await update.message.reply_text(
-            f"✅ **User unbanned successfully!**\n\n"
-            f"✅ **Unbanned User ID:** {user_id}",
-            parse_mode="Markdown",
-        )
+        if to_unban:
+            self.banned_users.difference_update(to_unban)
+            self.save_data()
+            summary = (
+                f"✅ **Users unbanned successfully!**\n\n"
+                f"✅ **Unbanned ({len(to_unban)}):** {self.preview(to_unban)}"
+            )
+        else:
+            summary = "❌ **No users were unbanned!**\n"
+
+        if not_banned:
+            summary += f"\nℹ️ **Not banned ({len(not_banned)}):** {self.preview(not_banned)}"
+        if invalid:
+            summary += f"\n❌ **Invalid IDs ({len(invalid)}):** {self.preview(invalid, code=True)}"
+        await reply_chunked(update.message, summary, parse_mode="Markdown")
 
     async def resetgiveaway_command_admin(self, update: Update, context: ContextTypes.DEFAULT_TYPE):
         if not update.message:
@@ -0,0 +1,246 @@
+# render.py
+import asyncio
+import re
+from typing import List
+
+from telegram import InlineKeyboardButton, InlineKeyboardMarkup
+from telegram.constants import MessageLimit
+from telegram.error import RetryAfter
+from telegram.helpers import escape_markdown
+
+# Telegram rejects messages longer than this (counted in UTF-16 code units)
+MAX_MESSAGE_LENGTH = MessageLimit.MAX_TEXT_LENGTH
+# Longer outputs are attached as a text file instead of flooding the chat
+MAX_CHUNKS = 5
+# How many times to resend a chunk after Telegram asks us to slow down
+MAX_RETRIES = 3
+
+# Markdown markup left after escaping: `\x` escapes and bare entity markers
+MARKUP_RE = re.compile(r"\\([_*`\[])|[*`]")
+
+
+# ===== Escaping for parse_mode="Markdown" =====
+def md(value) -> str:
+    """Escape a dynamic value so it renders literally in Markdown text."""
+    return escape_markdown(str(value), version=1)
+
+
+def md_code(value) -> str:
+    """Wrap a dynamic value in an inline code span.
+
+    Legacy Markdown has no escape inside code spans, so backticks are
+    swapped for quotes instead.
+    """
+    return "`" + str(value).replace("`", "'") + "`"
+
+
+# ===== Static messages and keyboards (built once at import) =====
+START_KEYBOARD = InlineKeyboardMarkup(
+    [
+        [InlineKeyboardButton("🎁 Redeem Code", callback_data="redeem_help")],
+        [InlineKeyboardButton("🏆 Leaderboard", callback_data="leaderboard")],
+        [InlineKeyboardButton("ℹ️ Bot Info", callback_data="info")],
+        [InlineKeyboardButton("❓ Help", callback_data="help")],
+    ]
+)
+
+WELCOME_TEMPLATE = """
+🎉 **Welcome to ZIHAN GIVEAWAY Bot!** 🇵🇸
+
+Hello {first_name}! 👋
+
+🎁 Ready to claim some amazing prizes? Use your redemption codes here!
+🏆 Compete with others and see who's winning!
+📱 Easy to use - just follow the commands!
+
+Choose an option below to get started:
+"""
+
+INFO_TEXT = """
+🤖 **ZIHAN GIVEAWAY BOT** 🇵🇸
+
+👨‍💻 **Developer:** Latiful Hassan Zihan
+📱 **Telegram:** @alwayzihan
+🌍 **Location:** Bangladesh 🇧🇩
+💻 **Language:** Python
+
+📋 **Available Commands:**
+
+👤 **User Commands**
+/start - Shows the main welcome menu
+/redeem <code> - Claim a prize with your code
+/leaderboard - See the top winners
+/help - Shows this help message
+
+👑 **Admin Commands**
+/stats - View bot statistics
+/listcodes - List all codes and prizes
+/addcode <code> - Add a new code
+/addprize <code|prefix\\*> <prize> - Set prize for codes
+/delcode <code...|prefix\\*> - Delete codes
+/gencode <num> <prefix> - Generate codes
+/broadcast <msg> - Send a message to all users
+/ban <user\\_id...> - Ban users
+/unban <user\\_id...> - Unban users
+/resetgiveaway - Clear the winner list for a new giveaway
+/stopbot - Stop the bot
+
+🎁 **Happy claiming!**
+"""
+
+HELP_TEXT = """
+❓ **HELP & INSTRUCTIONS**
+
+🎁 **How to redeem codes:**
+1. Get a code from @alwayszihan
+2. Use `/redeem <your_code>`
+3. Enjoy your prize! 🎉
+
+📝 **Examples:**
+• `/redeem GIFT123` - Redeem code GIFT123
+• `/leaderboard` - See top winners
+• `/info` - Bot information
+
+⚠️ **Important Notes:**
+• Each code can only be used once
+• Codes are case-insensitive
+• Contact @alwayszihan for new codes
+
+🆘 **Need help?** Contact @alwayszihan
+"""
+
+
+def render_welcome(first_name: str) -> str:
+    return WELCOME_TEMPLATE.format(first_name=md(first_name))
+
+
+# ===== Size-aware sending =====
+def text_length(text: str) -> int:
+    """Length as Telegram counts it (UTF-16 code units)."""
+    return len(text.encode("utf-16-le")) // 2
+
+
+def strip_markdown(text: str) -> str:
+    """Plain-text version of a Markdown message, for sending as a file."""
+    return MARKUP_RE.sub(lambda m: m.group(1) or "", text)
+
+
+def fit_length(text: str, limit: int) -> int:
+    """Number of leading characters of `text` that fit in `limit` UTF-16 units."""
+    used = 0
+    for i, char in enumerate(text):
+        used += 2 if ord(char) > 0xFFFF else 1
+        if used > limit:
+            return i
+    return len(text)
+
+
+def safe_cut(line: str, cut: int) -> int:
+    """Largest position <= `cut` where `line` can be split without breaking
+    a `\\x` escape or leaving a `*`, `_` or `` ` `` entity open.
+
+    Returns 0 if there is no such position.
+    """
+    best = 0
+    entity = None
+    escaped = False
+    for i, char in enumerate(line[:cut]):
+        if escaped:
+            escaped = False
+        elif entity == "`":
+            if char == "`":
+                entity = None
+        elif char == "\\":
+            escaped = True
+        elif entity is not None:
+            if char == entity:
+                entity = None
+        elif char in "*_`":
+            entity = char
+        if entity is None and not escaped:
+            best = i + 1
+    return best
+
+
+def split_message(text: str, limit: int = MAX_MESSAGE_LENGTH) -> List[str]:
+    """Split text into chunks no longer than `limit`.
+
+    Chunks break on line boundaries so Markdown entities (which never span
+    lines in this bot) stay intact. A single line over the limit is cut at
+    the last point outside any entity or escape; if no such point exists,
+    its markup is dropped and the line is escaped as plain text first.
+    """
+    if text_length(text) <= limit:
+        return [text]
+
+    chunks: List[str] = []
+    current: List[str] = []
+    current_len = 0
+    for line in text.split("\n"):
+        line_len = text_length(line)
+
+        while line_len > limit:
+            if current:
+                chunks.append("\n".join(current))
+                current, current_len = [], 0
+            safe = safe_cut(line, fit_length(line, limit))
+            if not safe:
+                # An entity longer than a whole message can't be split; send the line as plain text
+                line = md(strip_markdown(line))
+                line_len = text_length(line)
+                continue
+            chunks.append(line[:safe])
+            line = line[safe:]
+            line_len = text_length(line)
+
+        # +1 for the newline that joins this line to the previous one
+        added = line_len + (1 if current else 0)
+        if current and current_len + added > limit:
+            chunks.append("\n".join(current))
+            current, current_len = [line], line_len
+        else:
+            current.append(line)
+            current_len += added
+
+    if current:
+        chunks.append("\n".join(current))
+    return [chunk for chunk in chunks if chunk.strip()]
+
+
+async def send_with_retry(send, *args, **kwargs):
+    """Call a Telegram send method, waiting out any flood-control RetryAfter."""
+    for attempt in range(MAX_RETRIES + 1):
+        try:
+            return await send(*args, **kwargs)
+        except RetryAfter as e:
+            if attempt == MAX_RETRIES:
+                raise
+            delay = e.retry_after
+            # Newer python-telegram-bot versions report a timedelta
+            if hasattr(delay, "total_seconds"):
+                delay = delay.total_seconds()
+            await asyncio.sleep(delay)
+
+
+async def reply_chunked(message, text: str, reply_markup=None, filename: str = "output.txt", **kwargs):
+    """Reply with `text`, split into as many messages as needed, in order.
+
+    Chunks go out back to back, so the handler doesn't hold up other
+    updates; flood control is handled by resending after RetryAfter. Output
+    needing more than MAX_CHUNKS messages is sent as a plain-text file
+    instead. The keyboard (if any) is attached to the last message only.
+    """
+    chunks = split_message(text)
+    if len(chunks) > MAX_CHUNKS:
+        await send_with_retry(
+            message.reply_document,
+            document=strip_markdown(text).encode("utf-8"),
+            filename=filename,
+            caption=f"📎 Output is too long for chat ({len(chunks)} messages), sent as a file.",
+            reply_markup=reply_markup,
+        )
+        return
+
+    for i, chunk in enumerate(chunks):
+        markup = reply_markup if i == len(chunks) - 1 else None
+        await send_with_retry(message.reply_text, chunk, reply_markup=markup, **kwargs)